@@ -862,6 +862,20 @@ features are present in the code. Uses secret tags (check source) per
 experimented feature.""",
 )
 
+debug_group.add_option(
+    "--range-fold-threshold",
+    action="store",
+    dest="range_fold_threshold",
+    metavar="N",
+    default=None,
+    github_action=False,
+    help="""\
+Python2 'range' calls with constant arguments are computed to a list at
+compile time when the result has fewer elements than this. Python3 'range'
+and Python2 'xrange' are computed regardless of size. For Nuitka development
+only. Defaults to 256.""",
+)
+
 debug_group.add_option(
     "--explain-imports",
     action="store_true",
@@ -548,6 +548,16 @@ Error, the value given for '--onefile-child-grace-time' must be integer."""
 
         _warnOnefileOnlyOption("--onefile-child-grace-time")
 
+    if options.range_fold_threshold is not None:
+        if not options.range_fold_threshold.isdigit():
+            Tracing.options_logger.sysexit(
+                """\
+Error, the value given for '--range-fold-threshold' must be integer."""
+            )
+
+        # Used for every range call, do not convert it each time.
+        options.range_fold_threshold = int(options.range_fold_threshold)
+
     if getShallIncludeExternallyDataFilePatterns():
         _warnOnefileOnlyOption("--include-onefile-external-data")
 
@@ -1690,6 +1700,15 @@ def isShowScons():
     return options.show_scons
 
 
+def getRangeFoldThreshold():
+    """*int* = ``--range-fold-threshold``"""
+    return (
+        options.range_fold_threshold
+        if options.range_fold_threshold is not None
+        else 256
+    )
+
+
 def getJobLimit():
     """*int*, value of ``--jobs`` / "-j" or number of CPU kernels"""
     jobs = options.jobs
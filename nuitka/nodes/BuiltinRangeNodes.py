@@ -9,8 +9,6 @@ result of it can be predicted still, and these are interesting for warnings.
 
 """
 
-import math
-
 from nuitka.PythonVersions import python_version
 from nuitka.specs import BuiltinParameterSpecs
 
@@ -29,14 +27,68 @@ from .IterationHandles import (
 from .NodeMakingHelpers import makeConstantReplacementNode
 from .shapes.BuiltinTypeShapes import tshape_xrange
 
+# Marker for not yet computed cached values, "None" is a valid value for them.
+_UNSET = object()
+
+# Slots of the range nodes for the cached values, see "_resetCachedValues".
+_cached_value_slots = (
+    "iteration_length",
+    "integer_values",
+    "side_effects",
+    "may_raise",
+    "non_integer_child",
+)
 
-class ExpressionBuiltinRangeMixin(ExpressionListShapeExactMixin):
-    """Mixin class for range nodes with 1/2/3 arguments."""
+
+class ExpressionBuiltinRangeLikeMixin(object):
+    """Mixin class for range and xrange nodes with 1/2/3 arguments."""
 
     # Mixins are required to define empty slots
     __slots__ = ()
 
-    builtin_spec = BuiltinParameterSpecs.builtin_range_spec
+    # Float arguments have integer values, but only some built-ins reject them.
+    reject_float_children = False
+
+    def getIterationLength(self):
+        result = self.iteration_length
+
+        if result is _UNSET:
+            result = self.iteration_length = self._computeIterationLength()
+
+        return result
+
+    def _getIntegerValues(self):
+        """Integer values of the children, None where not known."""
+        result = self.integer_values
+
+        if result is _UNSET:
+            result = []
+
+            for child in self.getVisitableNodes():
+                # Float constants like "inf" and "nan" have no integer value.
+                try:
+                    value = child.getIntegerValue()
+                except (OverflowError, ValueError):
+                    value = None
+
+                result.append(value)
+
+            result = self.integer_values = tuple(result)
+
+        return result
+
+    def _hasZeroStep(self):
+        """Is the step known to be zero, which makes the call raise."""
+        values = self._getIntegerValues()
+
+        return len(values) == 3 and values[2] == 0
+
+    def _resetCachedValues(self):
+        self.iteration_length = _UNSET
+        self.integer_values = _UNSET
+        self.side_effects = None
+        self.may_raise = None
+        self.non_integer_child = None
 
     def getTruthValue(self):
         length = self.getIterationLength()
@@ -47,41 +99,70 @@ class ExpressionBuiltinRangeMixin(ExpressionListShapeExactMixin):
             return length > 0
 
     def mayHaveSideEffects(self):
-        for child in self.getVisitableNodes():
-            if child.mayHaveSideEffects():
-                return True
+        result = self.side_effects
 
-            if child.getIntegerValue() is None:
-                return True
+        if result is None:
+            result = self.side_effects = self._computeSideEffects()
+
+        return result
 
-            if python_version >= 0x270 and child.isExpressionConstantFloatRef():
+    def _hasNonIntegerChild(self):
+        """Is any child not known to be an integer value."""
+        result = self.non_integer_child
+
+        if result is None:
+            result = None in self._getIntegerValues()
+
+            # Floats have integer values, but may be rejected.
+            if not result and self.reject_float_children and python_version >= 0x270:
+                result = any(
+                    child.isExpressionConstantFloatRef()
+                    for child in self.getVisitableNodes()
+                )
+
+            self.non_integer_child = result
+
+        return result
+
+    def _computeSideEffects(self):
+        if self._hasNonIntegerChild():
+            return True
+
+        for child in self.getVisitableNodes():
+            if child.mayHaveSideEffects():
                 return True
 
         return False
 
     def mayRaiseException(self, exception_type):
-        for child in self.getVisitableNodes():
-            if child.mayRaiseException(exception_type):
-                return True
+        # Only the most general question is asked repeatedly, cache that.
+        if exception_type is not BaseException:
+            return self._computeMayRaise(exception_type)
 
-            # TODO: Should take exception_type value into account here.
-            if child.getIntegerValue() is None:
-                return True
+        result = self.may_raise
 
-            if python_version >= 0x270 and child.isExpressionConstantFloatRef():
-                return True
+        if result is None:
+            result = self.may_raise = self._computeMayRaise(BaseException)
 
-        step = self.subnode_step
+        return result
 
-        # A step of 0 will raise.
-        if step is not None and step.getIntegerValue() == 0:
+    def _computeMayRaise(self, exception_type):
+        # TODO: Should take exception_type value into account here.
+        if self._hasNonIntegerChild():
             return True
 
-        return False
+        for child in self.getVisitableNodes():
+            if child.mayRaiseException(exception_type):
+                return True
+
+        return self._hasZeroStep()
 
     def computeBuiltinSpec(self, trace_collection, given_values):
         assert self.builtin_spec is not None, self
 
+        # Children were just computed, their values may have changed.
+        self._resetCachedValues()
+
         if not self.builtin_spec.isCompileTimeComputable(given_values):
             trace_collection.onExceptionRaiseExit(BaseException)
 
@@ -96,6 +177,22 @@ class ExpressionBuiltinRangeMixin(ExpressionListShapeExactMixin):
             % (self.builtin_spec.getName()),
         )
 
+    def canPredictIterationValues(self):
+        return self.getIterationLength() is not None
+
+
+class ExpressionBuiltinRangeMixin(
+    ExpressionBuiltinRangeLikeMixin, ExpressionListShapeExactMixin
+):
+    """Mixin class for range nodes with 1/2/3 arguments."""
+
+    # Mixins are required to define empty slots
+    __slots__ = ()
+
+    builtin_spec = BuiltinParameterSpecs.builtin_range_spec
+
+    reject_float_children = True
+
     def computeExpressionIter1(self, iter_node, trace_collection):
         assert python_version < 0x300
 
@@ -118,13 +215,12 @@ class ExpressionBuiltinRangeMixin(ExpressionListShapeExactMixin):
             "Replaced 'range' with 'xrange' built-in call for iteration.",
         )
 
-    def canPredictIterationValues(self):
-        return self.getIterationLength() is not None
-
 
 class ExpressionBuiltinRange1(
     ExpressionBuiltinRangeMixin, ChildHavingLowMixin, ExpressionBase
 ):
+    __slots__ = _cached_value_slots
+
     kind = "EXPRESSION_BUILTIN_RANGE1"
 
     python_version_spec = "< 0x300"
@@ -139,6 +235,13 @@ class ExpressionBuiltinRange1(
 
         ExpressionBase.__init__(self, source_ref)
 
+        self._resetCachedValues()
+
+    def replaceChild(self, old_node, new_node):
+        ChildHavingLowMixin.replaceChild(self, old_node, new_node)
+
+        self._resetCachedValues()
+
     def computeExpression(self, trace_collection):
         low = self.subnode_low
 
@@ -146,8 +249,8 @@ class ExpressionBuiltinRange1(
             trace_collection=trace_collection, given_values=(low,)
         )
 
-    def getIterationLength(self):
-        low = self.subnode_low.getIntegerValue()
+    def _computeIterationLength(self):
+        (low,) = self._getIntegerValues()
 
         if low is None:
             return None
@@ -155,19 +258,17 @@ class ExpressionBuiltinRange1(
         return max(0, low)
 
     def getIterationHandle(self):
-        low = self.subnode_low.getIntegerValue()
-        if low is None:
+        if self.getIterationLength() is None:
             return None
 
+        (low,) = self._getIntegerValues()
+
         return IterationHandleRange1(low, self.source_ref)
 
     def getIterationValue(self, element_index):
         length = self.getIterationLength()
 
-        if length is None:
-            return None
-
-        if element_index > length:
+        if length is None or element_index >= length:
             return None
 
         # TODO: Make sure to cast element_index to what CPython will give, for
@@ -183,6 +284,8 @@ class ExpressionBuiltinRange1(
 class ExpressionBuiltinRange2(
     ExpressionBuiltinRangeMixin, ChildrenHavingLowHighMixin, ExpressionBase
 ):
+    __slots__ = _cached_value_slots
+
     kind = "EXPRESSION_BUILTIN_RANGE2"
 
     python_version_spec = "< 0x300"
@@ -201,7 +304,12 @@ class ExpressionBuiltinRange2(
 
         ExpressionBase.__init__(self, source_ref)
 
-    builtin_spec = BuiltinParameterSpecs.builtin_range_spec
+        self._resetCachedValues()
+
+    def replaceChild(self, old_node, new_node):
+        ChildrenHavingLowHighMixin.replaceChild(self, old_node, new_node)
+
+        self._resetCachedValues()
 
     def computeExpression(self, trace_collection):
         assert python_version < 0x300
@@ -213,55 +321,33 @@ class ExpressionBuiltinRange2(
             trace_collection=trace_collection, given_values=(low, high)
         )
 
-    def getIterationLength(self):
-        low = self.subnode_low
-        high = self.subnode_high
-
-        low = low.getIntegerValue()
+    def _computeIterationLength(self):
+        low, high = self._getIntegerValues()
 
-        if low is None:
-            return None
-
-        high = high.getIntegerValue()
-
-        if high is None:
+        if low is None or high is None:
             return None
 
         return max(0, high - low)
 
     def getIterationHandle(self):
-        low = self.subnode_low.getIntegerValue()
-        if low is None:
+        if self.getIterationLength() is None:
             return None
 
-        high = self.subnode_high.getIntegerValue()
-        if high is None:
-            return None
+        low, high = self._getIntegerValues()
 
         return IterationHandleRange2(low, high, self.source_ref)
 
     def getIterationValue(self, element_index):
-        low = self.subnode_low
-        high = self.subnode_high
-
-        low = low.getIntegerValue()
-
-        if low is None:
-            return None
-
-        high = high.getIntegerValue()
+        length = self.getIterationLength()
 
-        if high is None:
+        if length is None or element_index >= length:
             return None
 
-        result = low + element_index
+        low, _high = self._getIntegerValues()
 
-        if result >= high:
-            return None
-        else:
-            return makeConstantReplacementNode(
-                constant=result, node=self, user_provided=False
-            )
+        return makeConstantReplacementNode(
+            constant=low + element_index, node=self, user_provided=False
+        )
 
     def isKnownToBeIterable(self, count):
         return count is None or count == self.getIterationLength()
@@ -270,6 +356,8 @@ class ExpressionBuiltinRange2(
 class ExpressionBuiltinRange3(
     ExpressionBuiltinRangeMixin, ChildrenHavingLowHighStepMixin, ExpressionBase
 ):
+    __slots__ = _cached_value_slots
+
     kind = "EXPRESSION_BUILTIN_RANGE3"
 
     python_version_spec = "< 0x300"
@@ -286,7 +374,12 @@ class ExpressionBuiltinRange3(
 
         ExpressionBase.__init__(self, source_ref)
 
-    builtin_spec = BuiltinParameterSpecs.builtin_range_spec
+        self._resetCachedValues()
+
+    def replaceChild(self, old_node, new_node):
+        ChildrenHavingLowHighStepMixin.replaceChild(self, old_node, new_node)
+
+        self._resetCachedValues()
 
     def computeExpression(self, trace_collection):
         low = self.subnode_low
@@ -297,96 +390,47 @@ class ExpressionBuiltinRange3(
             trace_collection=trace_collection, given_values=(low, high, step)
         )
 
-    def getIterationLength(self):
-        low = self.subnode_low
-        high = self.subnode_high
-        step = self.subnode_step
-
-        low = low.getIntegerValue()
-
-        if low is None:
-            return None
+    def _computeIterationLength(self):
+        low, high, step = self._getIntegerValues()
 
-        high = high.getIntegerValue()
-
-        if high is None:
+        if low is None or high is None or step is None:
             return None
 
-        step = step.getIntegerValue()
-
-        if step is None:
-            return None
-
-        # Give up on this, will raise ValueError.
-        if step == 0:
-            return None
-
-        if low < high:
-            if step < 0:
-                estimate = 0
-            else:
-                estimate = math.ceil(float(high - low) / step)
-        else:
-            if step > 0:
-                estimate = 0
-            else:
-                estimate = math.ceil(float(high - low) / step)
-
-        estimate = round(estimate)
-
-        assert estimate >= 0
-
-        return int(estimate)
-
-    def canPredictIterationValues(self):
-        return self.getIterationLength() is not None
+        return BuiltinParameterSpecs.computeRangeLength(low, high, step)
 
     def getIterationHandle(self):
-        low = self.subnode_low.getIntegerValue()
-        if low is None:
-            return None
-
-        high = self.subnode_high.getIntegerValue()
-        if high is None:
-            return None
-
-        step = self.subnode_step.getIntegerValue()
-        if step is None:
+        # Unknown values or step 0, then there is no length and no handle. Empty
+        # ranges still get one, 'any' and 'all' predict their result from it.
+        if self.getIterationLength() is None:
             return None
 
-        # Give up on this, will raise ValueError.
-        if step == 0:
-            return None
+        low, high, step = self._getIntegerValues()
 
         return IterationHandleRange3(low, high, step, self.source_ref)
 
     def getIterationValue(self, element_index):
-        low = self.subnode_low.getIntegerValue()
-
-        if low is None:
-            return None
-
-        high = self.subnode_high.getIntegerValue()
+        # Checking against the length also covers negative steps.
+        length = self.getIterationLength()
 
-        if high is None:
+        if length is None or element_index >= length:
             return None
 
-        step = self.subnode_step.getIntegerValue()
-
-        result = low + step * element_index
+        low, _high, step = self._getIntegerValues()
 
-        if result >= high:
-            return None
+        if step == 1:
+            result = low + element_index
         else:
-            return makeConstantReplacementNode(
-                constant=result, node=self, user_provided=False
-            )
+            result = low + step * element_index
+
+        return makeConstantReplacementNode(
+            constant=result, node=self, user_provided=False
+        )
 
     def isKnownToBeIterable(self, count):
         return count is None or count == self.getIterationLength()
 
 
-class ExpressionBuiltinXrangeMixin(object):
+class ExpressionBuiltinXrangeMixin(ExpressionBuiltinRangeLikeMixin):
     """Mixin class for xrange nodes with 1/2/3 arguments."""
 
     # Mixins are required to define empty slots
@@ -398,61 +442,6 @@ class ExpressionBuiltinXrangeMixin(object):
     def getTypeShape():
         return tshape_xrange
 
-    def canPredictIterationValues(self):
-        return self.getIterationLength() is not None
-
-    def getTruthValue(self):
-        length = self.getIterationLength()
-
-        if length is None:
-            return None
-        else:
-            return length > 0
-
-    def mayHaveSideEffects(self):
-        for child in self.getVisitableNodes():
-            if child.mayHaveSideEffects():
-                return True
-
-            if child.getIntegerValue() is None:
-                return True
-
-        return False
-
-    def mayRaiseException(self, exception_type):
-        for child in self.getVisitableNodes():
-            if child.mayRaiseException(exception_type):
-                return True
-
-            # TODO: Should take exception_type value into account here.
-            if child.getIntegerValue() is None:
-                return True
-
-        step = self.subnode_step
-
-        # A step of 0 will raise.
-        if step is not None and step.getIntegerValue() == 0:
-            return True
-
-        return False
-
-    def computeBuiltinSpec(self, trace_collection, given_values):
-        assert self.builtin_spec is not None, self
-
-        if not self.builtin_spec.isCompileTimeComputable(given_values):
-            trace_collection.onExceptionRaiseExit(BaseException)
-
-            # TODO: Raise exception known step 0.
-
-            return self, None, None
-
-        return trace_collection.getCompileTimeComputationResult(
-            node=self,
-            computation=lambda: self.builtin_spec.simulateCall(given_values),
-            description="Built-in call to '%s' computed."
-            % (self.builtin_spec.getName()),
-        )
-
     def computeExpressionIter1(self, iter_node, trace_collection):
         # No exception will be raised on xrange iteration, but there is nothing to
         # lower for, virtual method: pylint: disable=no-self-use
@@ -463,6 +452,8 @@ class ExpressionBuiltinXrangeMixin(object):
 class ExpressionBuiltinXrange1(
     ExpressionBuiltinXrangeMixin, ChildHavingLowMixin, ExpressionBase
 ):
+    __slots__ = _cached_value_slots
+
     kind = "EXPRESSION_BUILTIN_XRANGE1"
 
     named_children = ("low",)
@@ -475,6 +466,13 @@ class ExpressionBuiltinXrange1(
 
         ExpressionBase.__init__(self, source_ref)
 
+        self._resetCachedValues()
+
+    def replaceChild(self, old_node, new_node):
+        ChildHavingLowMixin.replaceChild(self, old_node, new_node)
+
+        self._resetCachedValues()
+
     def computeExpression(self, trace_collection):
         low = self.subnode_low
 
@@ -483,8 +481,8 @@ class ExpressionBuiltinXrange1(
             trace_collection=trace_collection, given_values=(low,)
         )
 
-    def getIterationLength(self):
-        low = self.subnode_low.getIntegerValue()
+    def _computeIterationLength(self):
+        (low,) = self._getIntegerValues()
 
         if low is None:
             return None
@@ -494,10 +492,7 @@ class ExpressionBuiltinXrange1(
     def getIterationValue(self, element_index):
         length = self.getIterationLength()
 
-        if length is None:
-            return None
-
-        if element_index > length:
+        if length is None or element_index >= length:
             return None
 
         # TODO: Make sure to cast element_index to what CPython will give, for
@@ -510,6 +505,8 @@ class ExpressionBuiltinXrange1(
 class ExpressionBuiltinXrange2(
     ExpressionBuiltinXrangeMixin, ChildrenHavingLowHighMixin, ExpressionBase
 ):
+    __slots__ = _cached_value_slots
+
     kind = "EXPRESSION_BUILTIN_XRANGE2"
 
     named_children = ("low", "high")
@@ -525,6 +522,13 @@ class ExpressionBuiltinXrange2(
 
         ExpressionBase.__init__(self, source_ref)
 
+        self._resetCachedValues()
+
+    def replaceChild(self, old_node, new_node):
+        ChildrenHavingLowHighMixin.replaceChild(self, old_node, new_node)
+
+        self._resetCachedValues()
+
     def computeExpression(self, trace_collection):
         low = self.subnode_low
         high = self.subnode_high
@@ -533,49 +537,32 @@ class ExpressionBuiltinXrange2(
             trace_collection=trace_collection, given_values=(low, high)
         )
 
-    def getIterationLength(self):
-        low = self.subnode_low
-        high = self.subnode_high
-
-        low = low.getIntegerValue()
-
-        if low is None:
-            return None
+    def _computeIterationLength(self):
+        low, high = self._getIntegerValues()
 
-        high = high.getIntegerValue()
-
-        if high is None:
+        if low is None or high is None:
             return None
 
         return max(0, high - low)
 
     def getIterationValue(self, element_index):
-        low = self.subnode_low
-        high = self.subnode_high
-
-        low = low.getIntegerValue()
-
-        if low is None:
-            return None
-
-        high = high.getIntegerValue()
+        length = self.getIterationLength()
 
-        if high is None:
+        if length is None or element_index >= length:
             return None
 
-        result = low + element_index
+        low, _high = self._getIntegerValues()
 
-        if result >= high:
-            return None
-        else:
-            return makeConstantReplacementNode(
-                constant=result, node=self, user_provided=False
-            )
+        return makeConstantReplacementNode(
+            constant=low + element_index, node=self, user_provided=False
+        )
 
 
 class ExpressionBuiltinXrange3(
     ExpressionBuiltinXrangeMixin, ChildrenHavingLowHighStepMixin, ExpressionBase
 ):
+    __slots__ = _cached_value_slots
+
     kind = "EXPRESSION_BUILTIN_XRANGE3"
 
     named_children = ("low", "high", "step")
@@ -590,6 +577,13 @@ class ExpressionBuiltinXrange3(
 
         ExpressionBase.__init__(self, source_ref)
 
+        self._resetCachedValues()
+
+    def replaceChild(self, old_node, new_node):
+        ChildrenHavingLowHighStepMixin.replaceChild(self, old_node, new_node)
+
+        self._resetCachedValues()
+
     def computeExpression(self, trace_collection):
         low = self.subnode_low
         high = self.subnode_high
@@ -599,68 +593,31 @@ class ExpressionBuiltinXrange3(
             trace_collection=trace_collection, given_values=(low, high, step)
         )
 
-    def getIterationLength(self):
-        low = self.subnode_low
-        high = self.subnode_high
-        step = self.subnode_step
-
-        low = low.getIntegerValue()
+    def _computeIterationLength(self):
+        low, high, step = self._getIntegerValues()
 
-        if low is None:
-            return None
-
-        high = high.getIntegerValue()
-
-        if high is None:
+        if low is None or high is None or step is None:
             return None
 
-        step = step.getIntegerValue()
-
-        if step is None:
-            return None
-
-        # Give up on this, will raise ValueError.
-        if step == 0:
-            return None
-
-        if low < high:
-            if step < 0:
-                estimate = 0
-            else:
-                estimate = math.ceil(float(high - low) / step)
-        else:
-            if step > 0:
-                estimate = 0
-            else:
-                estimate = math.ceil(float(high - low) / step)
-
-        estimate = round(estimate)
-
-        assert estimate >= 0
-
-        return int(estimate)
+        return BuiltinParameterSpecs.computeRangeLength(low, high, step)
 
     def getIterationValue(self, element_index):
-        low = self.subnode_low.getIntegerValue()
-
-        if low is None:
-            return None
-
-        high = self.subnode_high.getIntegerValue()
+        # Checking against the length also covers negative steps.
+        length = self.getIterationLength()
 
-        if high is None:
+        if length is None or element_index >= length:
             return None
 
-        step = self.subnode_step.getIntegerValue()
+        low, _high, step = self._getIntegerValues()
 
-        result = low + step * element_index
-
-        if result >= high:
-            return None
+        if step == 1:
+            result = low + element_index
         else:
-            return makeConstantReplacementNode(
-                constant=result, node=self, user_provided=False
-            )
+            result = low + step * element_index
+
+        return makeConstantReplacementNode(
+            constant=result, node=self, user_provided=False
+        )
 
 
 def makeExpressionBuiltinXrange(low, high, step, source_ref):
@@ -5,10 +5,10 @@
 
 """
 
-import math
 from abc import abstractmethod
 
 from nuitka.__past__ import xrange
+from nuitka.specs.BuiltinParameterSpecs import computeRangeLength
 from nuitka.utils.SlotMetaClasses import getMetaClassBase
 
 
@@ -375,20 +375,7 @@ class IterationHandleRange3(RangeIterationHandleBase):
         self.step = step_value
 
     def getIterationLength(self):
-        if self.low < self.high:
-            if self.step < 0:
-                estimate = 0
-            else:
-                estimate = math.ceil(float(self.high - self.low) / self.step)
-        else:
-            if self.step > 0:
-                estimate = 0
-            else:
-                estimate = math.ceil(float(self.high - self.low) / self.step)
-
-        assert estimate >= 0
-
-        return int(estimate)
+        return computeRangeLength(self.low, self.high, self.step)
 
 
 #     Part of "Nuitka", an optimizing Python compiler that is compatible and
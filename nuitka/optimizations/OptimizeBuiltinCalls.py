@@ -64,6 +64,7 @@ from nuitka.nodes.BuiltinRangeNodes import (
     ExpressionBuiltinXrange1,
     ExpressionBuiltinXrange2,
     ExpressionBuiltinXrange3,
+    makeExpressionBuiltinXrange,
 )
 from nuitka.nodes.BuiltinRefNodes import (
     ExpressionBuiltinAnonymousRef,
@@ -398,6 +399,13 @@ if python_version >= 0x300:
 
 def range_extractor(node):
     def selectRangeBuiltin(low, high, step, source_ref):
+        # When iterated directly, 'xrange' gives the same values without
+        # creating a list, so avoid the 'range' node only to lower it later.
+        if node.parent.isExpressionBuiltinIter1():
+            return makeExpressionBuiltinXrange(
+                low=low, high=high, step=step, source_ref=source_ref
+            )
+
         if high is None:
             return ExpressionBuiltinRange1(low=low, source_ref=source_ref)
         elif step is None:
@@ -5,8 +5,6 @@
 
 """
 
-import math
-
 from nuitka import Options
 from nuitka.__past__ import builtins
 from nuitka.PythonVersions import python_version
@@ -544,7 +542,35 @@ else:
     )
 
 
+def computeRangeLength(low, high, step):
+    """Length of range with the given integer values, None if it will raise."""
+
+    # Give up on this, will raise ValueError.
+    if step == 0:
+        return None
+
+    delta = high - low
+
+    # Stepping away from the end gives an empty range.
+    if (delta > 0) != (step > 0):
+        return 0
+
+    # Most common steps, avoid the division for these.
+    if step == 1:
+        return delta
+    if step == -1:
+        return -delta
+
+    # Integer ceil division, floats would lose precision for large values.
+    return -(-delta // step)
+
+
 class BuiltinRangeSpec(BuiltinParameterSpecNoKeywords):
+    @staticmethod
+    def isFoldableLength(length):
+        """Is a range of that length small enough to compute at compile time."""
+        return length < Options.getRangeFoldThreshold()
+
     def isCompileTimeComputable(self, values):
         # For ranges, we need have many cases that can prevent the ability
         # to pre-compute, pylint: disable=too-many-branches,too-many-return-statements
@@ -564,7 +590,7 @@ class BuiltinRangeSpec(BuiltinParameterSpecNoKeywords):
                 if not low.isNumberConstant():
                     return True
 
-                return low.getCompileTimeConstant() < 256
+                return self.isFoldableLength(low.getCompileTimeConstant())
             elif arg_count == 2:
                 low, high = values
 
@@ -573,8 +599,8 @@ class BuiltinRangeSpec(BuiltinParameterSpecNoKeywords):
                 if not low.isNumberConstant() or not high.isNumberConstant():
                     return True
 
-                return (
-                    high.getCompileTimeConstant() - low.getCompileTimeConstant() < 256
+                return self.isFoldableLength(
+                    high.getCompileTimeConstant() - low.getCompileTimeConstant()
                 )
             elif arg_count == 3:
                 low, high, step = values
@@ -594,16 +620,7 @@ class BuiltinRangeSpec(BuiltinParameterSpecNoKeywords):
                 if step == 0:
                     return True
 
-                if low < high:
-                    if step < 0:
-                        return True
-                    else:
-                        return math.ceil(float(high - low) / step) < 256
-                else:
-                    if step > 0:
-                        return True
-                    else:
-                        return math.ceil(float(high - low) / step) < 256
+                return self.isFoldableLength(computeRangeLength(low, high, step))
             else:
                 assert False
         else:
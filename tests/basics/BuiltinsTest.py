@@ -148,6 +148,20 @@ print(
     range(2**100, 2**100 + 2),
 )
 
+
+def largeRangeLengths(cond):
+    # Known values that are not constants, so the lengths get predicted.
+    return (
+        len(range(0, 2**60 + 1 if cond else 2**60 + 1, 3)),
+        len(range(2**60 + 1 if cond else 2**60 + 1, -1, -3)),
+        len(range(0, 2**60 + 1 if cond else 2**60 + 1, 2**40)),
+    )
+
+
+if str is not bytes:
+    # Python2 would create the lists for these.
+    print("Lengths of large ranges", largeRangeLengths(True))
+
 try:
     print("Range with 0 step gives:", end=" ")
     print(range(3, 8, 0))
@@ -160,6 +174,17 @@ try:
 except TypeError as e:
     print("Gives exception:", repr(e))
 
+
+def rangeToInfinity(start):
+    return range(start, 1e400)
+
+
+try:
+    print("Range with infinite float:", end=" ")
+    print(rangeToInfinity(1))
+except TypeError as e:
+    print("Gives exception:", repr(e))
+
 try:
     print("Empty range call", end=" ")
     print(range())
@@ -11,10 +11,14 @@ def calledRepeatedly(cond):
 
 
 def main():
-    # This makes the value of module_value2 harder to cache, we are changing the
-    # globals each time.
     global x
-    for x in range(50000):
+
+    # The loop variable is local, so the loop itself doesn't write the globals.
+    for count in range(50000):
+        # This makes the value of module_value2 harder to cache, we are changing
+        # the globals each time.
+        x = count
+
         # construct_begin
         calledRepeatedly(True)
         # construct_alternative